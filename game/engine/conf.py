@@ -92,6 +92,9 @@ class Conf (object):
     RES_F = None
     MIN_RES_W = (320, 180)
     ASPECT_RATIO = None
+    MAX_DIRTY_RECTS = 64
+    FULL_REDRAW_RATIO = .7
+    ROTATE_CACHE_SIZE = 2
 
     # input
     GRAB_EVENTS = dd(False)
@@ -773,7 +773,12 @@ If this quits the last (root) world, exit the game.
             if drawn is True:
                 update_display()
             elif drawn:
-                if len(drawn) > 60: # empirical - faster to update everything
+                # faster to update everything for many rects, or when they
+                # cover most of the display anyway
+                w, h = conf.RES
+                if (len(drawn) > conf.MAX_DIRTY_RECTS or
+                    sum(r[2] * r[3] for r in drawn) >=
+                    conf.FULL_REDRAW_RATIO * w * h):
                     update_display()
                 else:
                     update_display(drawn)
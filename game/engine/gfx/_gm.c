@@ -1,12 +1,82 @@
 #include <Python.h>
+#include <string.h>
 #include <pygame/pygame.h>
 
 // Python 3 support
 #ifndef PyString_FromString
 #define PyString_FromString PyUnicode_FromString
 #endif
+#if PY_MAJOR_VERSION >= 3
+#define PyString_InternFromString PyUnicode_InternFromString
+#endif
 
 #define MAX_QSORT_LEVELS 300
+#define RECT_POOL_SIZE 256
+
+// graphic attributes read by fastdraw, interned once on import rather than
+// built from a C string on every access
+enum {
+    A_WAS_VISIBLE, A_VISIBLE, A_LAST_POSTROT_RECT, A_POSTROT_RECT,
+    A_PLAIN_OPAQUE_IN, A_OPAQUE, A_DIRTY, A_BLIT_DRAW, A_SURFACE,
+    A_BLIT_FLAGS, A_RECT, A_LAST_RECT, N_ATTRS
+};
+const char* attr_names[N_ATTRS] = {
+    "was_visible", "visible", "_last_postrot_rect", "_postrot_rect",
+    "_plain_opaque_in", "opaque", "_dirty", "_blit_draw", "_surface",
+    "blit_flags", "_rect", "last_rect"
+};
+PyObject* attrs[N_ATTRS];
+
+int init_attrs (void) {
+    int i;
+    for (i = 0; i < N_ATTRS; i++) {
+        attrs[i] = PyString_InternFromString(attr_names[i]);
+        if (attrs[i] == NULL) return 0;
+    }
+    return 1;
+}
+
+// pygame.Rect instances we've finished with, for reuse
+PyObject* rect_pool[RECT_POOL_SIZE];
+int n_rect_pool = 0;
+
+PyObject* rect_new (int x, int y, int w, int h) {
+    // like PyRect_New4, but reuses a pooled rect if nothing else holds it
+    PyObject* r;
+    GAME_Rect* r_r;
+    while (n_rect_pool > 0) {
+        r = rect_pool[--n_rect_pool];
+        if (Py_REFCNT(r) == 1) {
+            r_r = &(((PyRectObject*) r)->r);
+            r_r->x = x;
+            r_r->y = y;
+            r_r->w = w;
+            r_r->h = h;
+            return r;
+        }
+        // still in use elsewhere: leave it alone
+        Py_DECREF(r);
+    }
+    return PyRect_New4(x, y, w, h);
+}
+
+void rect_release (PyObject* r) {
+    // steals a reference; r may be reused once no-one else references it
+    if (n_rect_pool < RECT_POOL_SIZE) rect_pool[n_rect_pool++] = r;
+    else Py_DECREF(r);
+}
+
+void rect_release_all (PyObject* rs) {
+    // release every rect in a list, and the list
+    int i, n = PyList_GET_SIZE(rs);
+    PyObject* r;
+    for (i = 0; i < n; i++) {
+        r = PyList_GET_ITEM(rs, i);
+        Py_INCREF(r);
+        rect_release(r);
+    }
+    Py_DECREF(rs);
+}
 
 void quicksort (int *arr, int elements) {
     // http://alienryderflex.com/quicksort/
@@ -41,36 +111,119 @@ void quicksort (int *arr, int elements) {
 }
 
 int find (int *arr, int n, int x, int i) {
-    for (; i < n; i++) {
-        if (arr[i] == x) return i;
+    // arr is sorted and unique; binary search in [i, n)
+    int j = n - 1, mid;
+    while (i < j) {
+        mid = (i + j) / 2;
+        if (arr[mid] < x) i = mid + 1;
+        else j = mid;
     }
-    return -1;
+    return (i < n && arr[i] == x) ? i : -1;
 }
 
-int set_add (int *arr, int n, int x) {
-    int i;
-    for (i = 0; i < n; i++) {
-        if (arr[i] == x) return 0;
+int uniq (int *arr, int n) {
+    // remove duplicates from a sorted array; returns the new size
+    int i, j = 0;
+    for (i = 1; i < n; i++) {
+        if (arr[i] != arr[j]) arr[++j] = arr[i];
     }
-    arr[n] = x;
+    return n > 0 ? j + 1 : 0;
+}
+
+int rect_clip (GAME_Rect* a, GAME_Rect* b, GAME_Rect* out) {
+    // like pygame.Rect.clip, without the Python call; returns whether the
+    // result is non-empty
+    int x0, y0, x1, y1;
+    x0 = a->x > b->x ? a->x : b->x;
+    y0 = a->y > b->y ? a->y : b->y;
+    x1 = a->x + a->w < b->x + b->w ? a->x + a->w : b->x + b->w;
+    y1 = a->y + a->h < b->y + b->h ? a->y + a->h : b->y + b->h;
+    if (x1 <= x0 || y1 <= y0) {
+        out->x = a->x;
+        out->y = a->y;
+        out->w = out->h = 0;
+        return 0;
+    }
+    out->x = x0;
+    out->y = y0;
+    out->w = x1 - x0;
+    out->h = y1 - y0;
     return 1;
 }
 
+void rect_union (GAME_Rect* a, GAME_Rect* b, GAME_Rect* out) {
+    // like pygame.Rect.union, for non-empty rects
+    int x0, y0, x1, y1;
+    x0 = a->x < b->x ? a->x : b->x;
+    y0 = a->y < b->y ? a->y : b->y;
+    x1 = a->x + a->w > b->x + b->w ? a->x + a->w : b->x + b->w;
+    y1 = a->y + a->h > b->y + b->h ? a->y + a->h : b->y + b->h;
+    out->x = x0;
+    out->y = y0;
+    out->w = x1 - x0;
+    out->h = y1 - y0;
+}
+
+int rects_overlap (GAME_Rect* a, GAME_Rect* b) {
+    // whether two non-empty rects share any area
+    return a->x < b->x + b->w && b->x < a->x + a->w &&
+           a->y < b->y + b->h && b->y < a->y + a->h;
+}
+
+int any_overlap (PyRectObject** add, int n_add, PyRectObject** rm,
+                 int n_rm) {
+    // whether any add rect overlaps another add rect or any rm rect;
+    // ignores empty rects
+    int i, j;
+    GAME_Rect* a, * b;
+    for (i = 0; i < n_add; i++) {
+        a = &(add[i]->r);
+        if (a->w <= 0 || a->h <= 0) continue;
+        for (j = i + 1; j < n_add; j++) {
+            b = &(add[j]->r);
+            if (b->w > 0 && b->h > 0 && rects_overlap(a, b)) return 1;
+        }
+        for (j = 0; j < n_rm; j++) {
+            b = &(rm[j]->r);
+            if (b->w > 0 && b->h > 0 && rects_overlap(a, b)) return 1;
+        }
+    }
+    return 0;
+}
+
 PyObject* mk_disjoint (PyObject* add, PyObject* rm) {
-    // both arguments are [pygame.Rect]
+    // both arguments are [pygame.Rect]; rm may be NULL if there's nothing
+    // to remove
     int n_rects[2], n_edges[2], i, j, k, l, row0, row1, col0, col1, in_rect,
-        r_i, r_left;
+        r_i, r_left, n_cols;
     PyRectObject** rects[2];
     GAME_Rect r;
-    int* edges[2], * grid;
+    int* edges[2];
+    unsigned char* grid, * row, mark;
     PyObject* r_o, * rs;
     // turn into arrays
     add = PySequence_Fast(add, "expected list"); // NOTE: ref[+1]
-    rm = PySequence_Fast(rm, "expected list"); // NOTE: ref[+2]
     n_rects[0] = PySequence_Fast_GET_SIZE(add);
-    n_rects[1] = PySequence_Fast_GET_SIZE(rm);
     rects[0] = (PyRectObject**) PySequence_Fast_ITEMS(add);
-    rects[1] = (PyRectObject**) PySequence_Fast_ITEMS(rm);
+    if (rm == NULL) {
+        n_rects[1] = 0;
+        rects[1] = NULL;
+    } else {
+        rm = PySequence_Fast(rm, "expected list"); // NOTE: ref[+2]
+        n_rects[1] = PySequence_Fast_GET_SIZE(rm);
+        rects[1] = (PyRectObject**) PySequence_Fast_ITEMS(rm);
+    }
+    if (!any_overlap(rects[0], n_rects[0], rects[1], n_rects[1])) {
+        // already disjoint: no need to split anything up
+        rs = PyList_New(0);
+        for (i = 0; i < n_rects[0]; i++) {
+            r = rects[0][i]->r;
+            if (r.w > 0 && r.h > 0) PyList_Append(rs, (PyObject*) rects[0][i]);
+        }
+        Py_XDECREF(rm); // NOTE: ref[-2]
+        Py_DECREF(add); // NOTE: ref[-1]
+        return rs;
+    }
     // get edges
     n_edges[0] = 0;
     n_edges[1] = 0;
@@ -80,21 +233,25 @@ PyObject* mk_disjoint (PyObject* add, PyObject* rm) {
     for (i = 0; i < 2; i++) { // rects
         for (j = 0; j < n_rects[i]; j++) { // add|rm
             r = rects[i][j]->r;
-            n_edges[0] += set_add(edges[0], n_edges[0], r.x);
-            n_edges[0] += set_add(edges[0], n_edges[0], r.x + r.w);
-            n_edges[1] += set_add(edges[1], n_edges[1], r.y);
-            n_edges[1] += set_add(edges[1], n_edges[1], r.y + r.h);
+            edges[0][n_edges[0]++] = r.x;
+            edges[0][n_edges[0]++] = r.x + r.w;
+            edges[1][n_edges[1]++] = r.y;
+            edges[1][n_edges[1]++] = r.y + r.h;
         }
     }
-    // sort edges
+    // sort edges and remove duplicates
     quicksort(edges[0], n_edges[0]);
     quicksort(edges[1], n_edges[1]);
+    n_edges[0] = uniq(edges[0], n_edges[0]);
+    n_edges[1] = uniq(edges[1], n_edges[1]);
     // generate grid of (rows of) subrects and mark contents
     // each has 2 if add, 1 if rm
-    i = (n_edges[0] - 1) * (n_edges[1] - 1);
-    grid = PyMem_New(int, i); // NOTE: alloc[+2]
-    for (j = 0; j < i; j++) grid[j] = 0;
+    n_cols = n_edges[0] - 1;
+    i = n_cols * (n_edges[1] - 1);
+    grid = PyMem_New(unsigned char, i); // NOTE: alloc[+2]
+    memset(grid, 0, i);
     for (i = 0; i < 2; i++) { // add|rm
+        mark = i == 0 ? 2 : 1;
         for (j = 0; j < n_rects[i]; j++) { // rects
             r = rects[i][j]->r;
             if (r.w > 0 && r.h > 0) {
@@ -103,12 +260,8 @@ PyObject* mk_disjoint (PyObject* add, PyObject* rm) {
                 col0 = find(edges[0], n_edges[0], r.x, 0);
                 col1 = find(edges[0], n_edges[0], r.x + r.w, col0);
                 for (k = row0; k < row1; k++) { // rows
-                    for (l = col0; l < col1; l++) { // cols
-                        if (i == 0) // add
-                            grid[(n_edges[0] - 1) * k + l] |= 2;
-                        else // rm (i == 1)
-                            grid[(n_edges[0] - 1) * k + l] |= 1;
-                    }
+                    row = grid + n_cols * k;
+                    for (l = col0; l < col1; l++) row[l] |= mark; // cols
                 }
             }
         }
@@ -125,12 +278,12 @@ PyObject* mk_disjoint (PyObject* add, PyObject* rm) {
                 in_rect = 0;
                 k = edges[1][r_i];
                 // NOTE: ref[+3]
-                r_o = PyRect_New4(r_left, k, edges[0][n_edges[0] - 1] - r_left,
-                                  edges[1][r_i + 1] - k);
+                r_o = rect_new(r_left, k, edges[0][n_edges[0] - 1] - r_left,
+                               edges[1][r_i + 1] - k);
                 PyList_Append(rs, r_o);
                 Py_DECREF(r_o); // NOTE: ref[-3]
             }
-            if (grid[(n_edges[0] - 1) * i + j] == 2) { // add and not rm
+            if (grid[n_cols * i + j] == 2) { // add and not rm
                 if (!in_rect) {
                     in_rect = 1;
                     r_i = i;
@@ -141,8 +294,8 @@ PyObject* mk_disjoint (PyObject* add, PyObject* rm) {
                 in_rect = 0;
                 k = edges[1][r_i];
                 // NOTE: ref[+3]
-                r_o = PyRect_New4(r_left, k, edges[0][j] - r_left,
-                                  edges[1][r_i + 1] - k);
+                r_o = rect_new(r_left, k, edges[0][j] - r_left,
+                               edges[1][r_i + 1] - k);
                 PyList_Append(rs, r_o);
                 Py_DECREF(r_o); // NOTE: ref[-3]
             }
@@ -152,8 +305,8 @@ PyObject* mk_disjoint (PyObject* add, PyObject* rm) {
         // last rect ended
         k = edges[1][r_i];
         // NOTE: ref[+3]
-        r_o = PyRect_New4(r_left, k, edges[0][n_edges[0] - 1] - r_left,
-                          edges[1][r_i + 1] - k);
+        r_o = rect_new(r_left, k, edges[0][n_edges[0] - 1] - r_left,
+                       edges[1][r_i + 1] - k);
         PyList_Append(rs, r_o);
         Py_DECREF(r_o); // NOTE: ref[-3]
     }
@@ -161,31 +314,155 @@ PyObject* mk_disjoint (PyObject* add, PyObject* rm) {
     PyMem_Free(grid); // NOTE: alloc[-2]
     PyMem_Free(edges[0]);
     PyMem_Free(edges[1]); // NOTE: alloc[-1]
-    Py_DECREF(rm); // NOTE: ref[-2]
+    Py_XDECREF(rm); // NOTE: ref[-2]
     Py_DECREF(add); // NOTE: ref[-1]
     return rs;
 }
 
+int queue_blits (PyObject* g, PyObject* rects, PyObject* blits, int whole) {
+    // do what Graphic._draw does, but add (source, dest, area, flags) to the
+    // blits list rather than blitting; if whole is true, area is None when
+    // drawing the entire surface; returns 0 on error
+    PyObject* g_sfc, * flags, * r_o, * area, * b, * pr;
+    GAME_Rect* r, * g_r;
+    int i, n = PyList_GET_SIZE(rects), ok = 1;
+    pr = PyObject_GetAttr(g, attrs[A_POSTROT_RECT]); // NOTE: ref[+1]
+    g_r = &(((PyRectObject*) pr)->r);
+    g_sfc = PyObject_GetAttr(g, attrs[A_SURFACE]); // NOTE: ref[+2]
+    flags = PyObject_GetAttr(g, attrs[A_BLIT_FLAGS]); // NOTE: ref[+3]
+    for (i = 0; i < n; i++) {
+        r_o = PyList_GET_ITEM(rects, i);
+        r = &(((PyRectObject*) r_o)->r);
+        if (whole && r->x == g_r->x && r->y == g_r->y && r->w == g_r->w &&
+            r->h == g_r->h) {
+            area = Py_None;
+            Py_INCREF(area); // NOTE: ref[+4]
+        } else {
+            // NOTE: ref[+4]
+            area = rect_new(r->x - g_r->x, r->y - g_r->y, r->w, r->h);
+        }
+        b = PyTuple_Pack(4, g_sfc, r_o, area, flags); // NOTE: ref[+5]
+        PyList_Append(blits, b);
+        Py_DECREF(b); // NOTE: ref[-5]
+        Py_DECREF(area); // NOTE: ref[-4]
+    }
+    Py_DECREF(flags); // NOTE: ref[-3]
+    Py_DECREF(g_sfc); // NOTE: ref[-2]
+    ok = PyObject_SetAttr(g, attrs[A_LAST_POSTROT_RECT], pr) == 0;
+    Py_DECREF(pr); // NOTE: ref[-1]
+    pr = PyObject_GetAttr(g, attrs[A_RECT]); // NOTE: ref[+1]
+    ok = ok && PyObject_SetAttr(g, attrs[A_LAST_RECT], pr) == 0;
+    Py_DECREF(pr); // NOTE: ref[-1]
+    return ok;
+}
+
+int flush_fblits (PyObject* sfc, PyObject* blits, int start, int end) {
+    // blit items start to end of blits, which all draw their whole source
+    // with the same flags, in one Surface.fblits call; returns 0 on error
+    PyObject* pairs, * b, * tmp;
+    int i;
+    pairs = PyList_New(end - start); // NOTE: ref[+1]
+    for (i = start; i < end; i++) {
+        b = PyList_GET_ITEM(blits, i);
+        // NOTE: ref[+2] ref[-2]
+        PyList_SET_ITEM(pairs, i - start, PyTuple_GetSlice(b, 0, 2));
+    }
+    tmp = PyObject_CallMethod(sfc, "fblits", "OO", pairs,
+                              PyTuple_GET_ITEM(PyList_GET_ITEM(blits, start),
+                                               3));
+    Py_DECREF(pairs); // NOTE: ref[-1]
+    if (tmp == NULL) return 0;
+    Py_DECREF(tmp);
+    return 1;
+}
+
+int flush_blits (PyObject* sfc, PyObject* blits, int whole) {
+    // perform and remove queued blits, in order; whole is as passed to
+    // queue_blits; returns 0 on error
+    PyObject* blit, * tmp, * b, * flags;
+    int i, j, n = PyList_GET_SIZE(blits);
+    if (n == 0) return 1;
+    if (whole) {
+        // Surface.fblits exists: use it for runs of whole-surface blits with
+        // the same flags, and Surface.blits for everything in between
+        i = 0;
+        while (i < n) {
+            b = PyList_GET_ITEM(blits, i);
+            j = i + 1;
+            if (PyTuple_GET_ITEM(b, 2) == Py_None) {
+                flags = PyTuple_GET_ITEM(b, 3);
+                while (j < n) {
+                    b = PyList_GET_ITEM(blits, j);
+                    if (PyTuple_GET_ITEM(b, 2) != Py_None ||
+                        PyObject_RichCompareBool(PyTuple_GET_ITEM(b, 3),
+                                                 flags, Py_EQ) != 1)
+                        break;
+                    j++;
+                }
+                if (!flush_fblits(sfc, blits, i, j)) return 0;
+            } else {
+                while (j < n &&
+                       PyTuple_GET_ITEM(PyList_GET_ITEM(blits, j), 2) !=
+                       Py_None)
+                    j++;
+                tmp = PyList_GetSlice(blits, i, j); // NOTE: ref[+1]
+                b = PyObject_CallMethod(sfc, "blits", "Oi", tmp, 0);
+                Py_DECREF(tmp); // NOTE: ref[-1]
+                if (b == NULL) return 0;
+                Py_DECREF(b);
+            }
+            i = j;
+        }
+    } else if (PyObject_HasAttrString(sfc, "blits")) {
+        // one call for everything (Pygame >= 1.9.4)
+        tmp = PyObject_CallMethod(sfc, "blits", "Oi", blits, 0);
+        if (tmp == NULL) return 0;
+        Py_DECREF(tmp);
+    } else {
+        blit = PyObject_GetAttrString(sfc, "blit"); // NOTE: ref[+1]
+        for (i = 0; i < n; i++) {
+            tmp = PyObject_CallObject(blit, PyList_GET_ITEM(blits, i));
+            if (tmp == NULL) {
+                Py_DECREF(blit); // NOTE: ref[-1]
+                return 0;
+            }
+            Py_DECREF(tmp);
+        }
+        Py_DECREF(blit); // NOTE: ref[-1]
+    }
+    return PyList_SetSlice(blits, 0, n, NULL) == 0;
+}
+
 PyObject* fastdraw (PyObject* self, PyObject* args) {
     // don't do much error checking because the point of this is performance
     // and we own the class calling this; guaranteed to get
-    // [obj], pygame.Surface, {obj: set(Graphic)}, [pygame.Rect]
-    // and layers is sorted
-    PyObject* layers_in, * sfc, * graphics_in, * dirty;
+    // [obj], pygame.Surface, {obj: set(Graphic)}, [pygame.Rect][, bool]
+    // and layers is sorted; if the last argument is true, dirty is a single
+    // rect covering the whole surface
+    PyObject* layers_in, * sfc, * graphics_in, * dirty, * full_in = NULL;
     PyObject** layers, *** graphics, ** gs, * g, * g_dirty, * g_rect, * r_o,
-            ** graphics_obj, * tmp, * tmp2, * pre_draw, * clip, * vis_tmp[2],
+            ** graphics_obj, * tmp, * tmp2, * pre_draw, * vis_tmp[2],
             * rtn, * opaque_in, * dirty_opaque, * l_dirty_opaque,
-            ** dirty_by_layer, * rs, * draw_in, * draw;
-    char* attrs[4] = {"was_visible", "visible", "_last_postrot_rect",
-                      "_postrot_rect"};
-    int n_layers, * n_graphics, i, j, k, l, n, n_dirty, r_new, r_good;
-    PyRectObject* r, * tmp_r;
-    if (!PyArg_UnpackTuple(args, "fastdraw", 4, 4, &layers_in, &sfc,
-                           &graphics_in, &dirty))
+            ** dirty_by_layer, * rs, * draw_in, * draw, * blits, * live;
+    int n_layers, * n_graphics, i, j, k, l, n, n_dirty, n_live, r_good, full,
+        fblits;
+    PyRectObject* r;
+    GAME_Rect g_r, r_r, ** g_rects, bbox, sfc_r;
+    signed char** g_opaque;
+    char** g_vis, * d_live;
+    long area;
+    if (!PyArg_UnpackTuple(args, "fastdraw", 4, 5, &layers_in, &sfc,
+                           &graphics_in, &dirty, &full_in))
         return NULL;
+    full = full_in != NULL && PyObject_IsTrue(full_in);
+    // nothing outside the surface's clip rect is drawn (this is the whole
+    // surface unless set otherwise)
+    tmp = PyObject_CallMethod(sfc, "get_clip", NULL); // NOTE: ref[+1]
+    if (tmp == NULL) return NULL;
+    sfc_r = ((PyRectObject*) tmp)->r;
+    Py_DECREF(tmp); // NOTE: ref[-1]
 
-    pre_draw = PyString_FromString("_pre_draw"); // NOTE: ref[+1a]
-    clip = PyString_FromString("clip"); // NOTE: ref[+1b]
+    pre_draw = PyString_FromString("_pre_draw"); // NOTE: ref[+1]
     // get arrays of layers, graphics and sizes
     // NOTE: ref[+2]
     layers_in = PySequence_Fast(layers_in, "layers: expected sequence");
@@ -194,6 +471,13 @@ PyObject* fastdraw (PyObject* self, PyObject* args) {
     graphics_obj = PyMem_New(PyObject*, n_layers); // NOTE: alloc[+1]
     n_graphics = PyMem_New(int, n_layers); // NOTE: alloc[+2]
     graphics = PyMem_New(PyObject**, n_layers); // NOTE: alloc[+3]
+    // graphics' _postrot_rect, fetched once
+    g_rects = PyMem_New(GAME_Rect*, n_layers); // NOTE: alloc[+4]
+    // 1 or 0 if a graphic's _opaque_in is the default and it's opaque or
+    // not, else -1
+    g_opaque = PyMem_New(signed char*, n_layers); // NOTE: alloc[+5]
+    // whether each graphic is visible
+    g_vis = PyMem_New(char*, n_layers); // NOTE: alloc[+6]
     for (i = 0; i < n_layers; i++) { // graphics_in
         // NOTE: ref[+3]
         tmp = PySequence_Fast(PyDict_GetItem(graphics_in, layers[i]),
@@ -202,6 +486,10 @@ PyObject* fastdraw (PyObject* self, PyObject* args) {
         graphics_obj[i] = tmp;
         n_graphics[i] = PySequence_Fast_GET_SIZE(tmp);
         graphics[i] = PySequence_Fast_ITEMS(tmp);
+        g_rects[i] = PyMem_New(GAME_Rect, n_graphics[i]); // NOTE: alloc[+7]
+        // NOTE: alloc[+8]
+        g_opaque[i] = PyMem_New(signed char, n_graphics[i]);
+        g_vis[i] = PyMem_New(char, n_graphics[i]); // NOTE: alloc[+9]
     }
     // get dirty rects from graphics
     for (i = 0; i < n_layers; i++) { // graphics
@@ -210,43 +498,66 @@ PyObject* fastdraw (PyObject* self, PyObject* args) {
             g = gs[j];
             PyObject_CallMethodObjArgs(g, pre_draw, NULL);
             if (PyErr_Occurred() != NULL) return NULL;
-            // NOTE: ref[+4] (list)
-            g_dirty = PyObject_GetAttrString(g, "_dirty");
-            for (k = 0; k < 2; k++) // last/current
-                // NOTE: ref[+5]
-                vis_tmp[k] = PyObject_GetAttrString(g, attrs[k]);
+            // NOTE: ref[+4] (pygame.Rect)
+            g_rect = PyObject_GetAttr(g, attrs[A_POSTROT_RECT]);
+            // only the on-surface part matters; this is empty for graphics
+            // that are entirely off the surface, so they're skipped cheaply
+            rect_clip(&(((PyRectObject*) g_rect)->r), &sfc_r,
+                      &(g_rects[i][j]));
+            Py_DECREF(g_rect); // NOTE: ref[-4]
+            vis_tmp[1] = PyObject_GetAttr(g, attrs[A_VISIBLE]); // NOTE: ref[+4]
+            g_vis[i][j] = vis_tmp[1] == Py_True;
+            // everything gets redrawn anyway
+            if (full) goto set_visible;
+            // NOTE: ref[+5]
+            tmp = PyObject_GetAttr(g, attrs[A_PLAIN_OPAQUE_IN]);
+            if (tmp == Py_True) {
+                tmp2 = PyObject_GetAttr(g, attrs[A_OPAQUE]); // NOTE: ref[+6]
+                g_opaque[i][j] = PyObject_IsTrue(tmp2);
+                Py_DECREF(tmp2); // NOTE: ref[-6]
+            } else g_opaque[i][j] = -1;
+            Py_DECREF(tmp); // NOTE: ref[-5]
+            // NOTE: ref[+5] (list)
+            g_dirty = PyObject_GetAttr(g, attrs[A_DIRTY]);
+            vis_tmp[0] = PyObject_GetAttr(g, attrs[A_WAS_VISIBLE]); // NOTE: ref[+6]
             if (vis_tmp[0] != vis_tmp[1]) {
                 // visiblity changed since last draw: set dirty everywhere
-                Py_DECREF(g_dirty); // NOTE: ref[-4]
-                g_dirty = PyList_New(1); // NOTE: ref[+4]
-                // NOTE: ref[+6]
-                g_rect = PyObject_GetAttrString(
-                    g, attrs[2 + (vis_tmp[1] == Py_True)]
-                );
-                PyList_SET_ITEM(g_dirty, 0, g_rect); // NOTE: ref[-6]
+                Py_DECREF(g_dirty); // NOTE: ref[-5]
+                g_dirty = PyList_New(1); // NOTE: ref[+5]
+                // NOTE: ref[+7]
+                g_rect = PyObject_GetAttr(g, attrs[
+                    vis_tmp[1] == Py_True ? A_POSTROT_RECT : A_LAST_POSTROT_RECT
+                ]);
+                PyList_SET_ITEM(g_dirty, 0, g_rect); // NOTE: ref[-7]
             }
             n = PyList_GET_SIZE(g_dirty);
             for (k = 0; k < 2; k++) { // last/current
                 if (vis_tmp[k] == Py_True) {
-                    // NOTE: ref[+6] (pygame.Rect)
-                    g_rect = PyObject_GetAttrString(g, attrs[2 + k]);
+                    if (k) g_r = g_rects[i][j];
+                    else {
+                        // NOTE: ref[+7] (pygame.Rect)
+                        g_rect = PyObject_GetAttr(g, attrs[A_LAST_POSTROT_RECT]);
+                        rect_clip(&(((PyRectObject*) g_rect)->r), &sfc_r,
+                                  &g_r);
+                        Py_DECREF(g_rect); // NOTE: ref[-7]
+                    }
                     for (l = 0; l < n; l++) { // g_dirty
-                        r_o = PyList_GET_ITEM(g_dirty, l); // pygame.Rect
-                        // NOTE: ref[+7]
-                        r_o = PyObject_CallMethodObjArgs(r_o, clip, g_rect,
-                                                         NULL);
-                        PyList_Append(dirty, r_o);
-                        Py_DECREF(r_o); // NOTE: ref[-7]
+                        // pygame.Rect
+                        r = (PyRectObject*) PyList_GET_ITEM(g_dirty, l);
+                        if (rect_clip(&(r->r), &g_r, &r_r)) {
+                            // NOTE: ref[+7]
+                            r_o = rect_new(r_r.x, r_r.y, r_r.w, r_r.h);
+                            PyList_Append(dirty, r_o);
+                            Py_DECREF(r_o); // NOTE: ref[-7]
+                        }
                     }
-                    Py_DECREF(g_rect); // NOTE: ref[-6]
                 }
             }
-            Py_DECREF(vis_tmp[0]);
-            Py_DECREF(vis_tmp[1]); // NOTE: ref[-5]
-            Py_DECREF(g_dirty); // NOTE: ref[-4]
-            tmp = PyObject_GetAttrString(g, "visible"); // NOTE: ref[+4]
-            PyObject_SetAttrString(g, "was_visible", tmp);
-            Py_DECREF(tmp); // NOTE: ref[-4]
+            Py_DECREF(vis_tmp[0]); // NOTE: ref[-6]
+            Py_DECREF(g_dirty); // NOTE: ref[-5]
+set_visible:
+            PyObject_SetAttr(g, attrs[A_WAS_VISIBLE], vis_tmp[1]);
+            Py_DECREF(vis_tmp[1]); // NOTE: ref[-4]
         }
     }
 
@@ -260,51 +571,104 @@ PyObject* fastdraw (PyObject* self, PyObject* args) {
 
     opaque_in = PyString_FromString("_opaque_in"); // NOTE: ref[+4]
     dirty_opaque = PyList_New(0); // NOTE: ref[+5]
-    dirty_by_layer = PyMem_New(PyObject*, n_layers); // NOTE: alloc[+4]
-    for (i = 0; i < n_layers; i++) { // graphics
+    dirty_by_layer = PyMem_New(PyObject*, n_layers); // NOTE: alloc[+10]
+    // whether each dirty rect is still visible through the opaque graphics
+    // in front; once hidden, layers behind never look at it again
+    d_live = PyMem_New(char, n_dirty); // NOTE: alloc[+11]
+    memset(d_live, 1, n_dirty);
+    n_live = n_dirty;
+    // when redrawing everything, draw every graphic in the whole surface
+    // (bottom layer first) rather than working out what's hidden
+    if (full) {
+        for (i = 0; i < n_layers; i++) {
+            Py_INCREF(dirty);
+            dirty_by_layer[i] = dirty; // NOTE: ref[+6]
+        }
+    }
+    else for (i = 0; i < n_layers; i++) { // graphics
+        if (n_live == 0 ||
+            (i > 0 && PyList_GET_SIZE(dirty_by_layer[i - 1]) == 0)) {
+            // dirty rects are already covered by opaque graphics in front, so
+            // this and all layers behind have nothing to draw
+            dirty_by_layer[i] = PyList_New(0); // NOTE: ref[+7]
+            continue;
+        }
         gs = graphics[i];
         n = n_graphics[i];
+        // dirty rects not yet hidden
+        if (n_live == n_dirty) {
+            live = dirty;
+            Py_INCREF(live); // NOTE: ref[+6]
+        } else {
+            live = PyList_New(0); // NOTE: ref[+6]
+            for (j = 0; j < n_dirty; j++) {
+                if (d_live[j]) PyList_Append(live, PyList_GET_ITEM(dirty, j));
+            }
+        }
         // get opaque regions of dirty rects
-        l_dirty_opaque = PyList_New(0); // NOTE: ref[+6]
+        l_dirty_opaque = PyList_New(0); // NOTE: ref[+7]
         for (j = 0; j < n_dirty; j++) { // dirty
-            r = (PyRectObject*) PyList_GET_ITEM(dirty, j); // pygame.Rect
-            r_new = 0;
+            if (!d_live[j]) continue;
+            // pygame.Rect
+            r_r = ((PyRectObject*) PyList_GET_ITEM(dirty, j))->r;
+            bbox = r_r;
             r_good = 1;
             for (k = 0; k < n; k++) { // gs
-                g = gs[k];
-                // NOTE: ref[+7]
-                g_rect = PyObject_GetAttrString(g, "_postrot_rect");
-                if (r_new) tmp_r = r;
-                // NOTE: ref[+8]
-                r = (PyRectObject*)
-                    PyObject_CallMethodObjArgs((PyObject*) r, clip, g_rect,
-                                               NULL);
-                if (r_new) Py_DECREF(tmp_r); // NOTE: ref[-8](k>0)
-                r_new = 1;
-                Py_DECREF(g_rect); // NOTE: ref[-7]
-                // NOTE: ref[+7]
-                tmp = PyObject_CallMethodObjArgs(g, opaque_in, (PyObject*) r,
-                                                 NULL);
-                if (PyErr_Occurred() != NULL) return NULL;
-                r_good = r->r.w > 0 && r->r.h > 0 && \
-                         PyObject_RichCompareBool(tmp, Py_True, Py_EQ);
-                Py_DECREF(tmp); // NOTE: ref[-7]
+                r_good = rect_clip(&r_r, &(g_rects[i][k]), &r_r);
+                if (!r_good) break;
+                if (g_opaque[i][k] >= 0) {
+                    // r_r is within the graphic's rect, so the default
+                    // _opaque_in is just whether it's opaque
+                    r_good = g_opaque[i][k];
+                } else {
+                    // NOTE: ref[+8]
+                    r_o = rect_new(r_r.x, r_r.y, r_r.w, r_r.h);
+                    // NOTE: ref[+9]
+                    tmp = PyObject_CallMethodObjArgs(gs[k], opaque_in, r_o,
+                                                     NULL);
+                    rect_release(r_o); // NOTE: ref[-8]
+                    if (PyErr_Occurred() != NULL) return NULL;
+                    r_good = PyObject_RichCompareBool(tmp, Py_True, Py_EQ);
+                    Py_DECREF(tmp); // NOTE: ref[-9]
+                }
                 if (!r_good) break;
             }
-            if (r_good) PyList_Append(l_dirty_opaque, (PyObject*) r);
-            if (r_new) Py_DECREF((PyObject*) r); // NOTE: ref[-8](k=0)
+            if (r_good) {
+                if (n == 0 || (r_r.x == bbox.x && r_r.y == bbox.y &&
+                               r_r.w == bbox.w && r_r.h == bbox.h)) {
+                    // all of it is hidden from here back
+                    d_live[j] = 0;
+                    n_live--;
+                }
+                if (n == 0) {
+                    PyList_Append(l_dirty_opaque, PyList_GET_ITEM(dirty, j));
+                } else {
+                    // NOTE: ref[+8]
+                    r_o = rect_new(r_r.x, r_r.y, r_r.w, r_r.h);
+                    PyList_Append(l_dirty_opaque, r_o);
+                    rect_release(r_o); // NOTE: ref[-8]
+                }
+            }
         }
         // undirty below opaque graphics and make dirty rects disjoint
-        // NOTE: ref[+7]
-        dirty_by_layer[i] = mk_disjoint(dirty, dirty_opaque);
+        // NOTE: ref[+8]
+        dirty_by_layer[i] = mk_disjoint(
+            live, PyList_GET_SIZE(dirty_opaque) > 0 ? dirty_opaque : NULL
+        );
         tmp = dirty_opaque;
-        // NOTE: ref[+8] (not sure why this returns a new reference)
+        // NOTE: ref[+9] (not sure why this returns a new reference)
         dirty_opaque = PySequence_InPlaceConcat(dirty_opaque, l_dirty_opaque);
-        Py_DECREF(tmp); // NOTE: ref[-5] ref[-8+5]
-        Py_DECREF(l_dirty_opaque); // NOTE: ref[-6] ref[-7+6]
+        Py_DECREF(tmp); // NOTE: ref[-5] ref[-9+5]
+        Py_DECREF(l_dirty_opaque); // NOTE: ref[-7]
+        Py_DECREF(live); // NOTE: ref[-6] ref[-8+6]
     }
 
     draw = PyString_FromString("_draw"); // NOTE: ref[+7]
+    // blits for graphics that don't override _draw, performed together
+    blits = PyList_New(0); // NOTE: ref[+8]
+    // Surface.fblits (pygame-ce) draws whole surfaces with common flags in one
+    // go, which is most of a full redraw
+    fblits = PyObject_HasAttrString(sfc, "fblits");
     // redraw in dirty rects
     for (i = n_layers - 1; i >= 0; i--) { // layers
         rs = dirty_by_layer[i];
@@ -312,36 +676,63 @@ PyObject* fastdraw (PyObject* self, PyObject* args) {
         gs = graphics[i];
         for (j = 0; j < n_graphics[i]; j++) { // gs
             g = gs[j];
-            tmp = PyObject_GetAttrString(g, "visible"); // NOTE: ref[+8]
-            if (tmp == Py_True) {
-                // NOTE: ref[+9]
-                g_rect = PyObject_GetAttrString(g, "_postrot_rect");
+            if (n > 0 && g_vis[i][j]) {
+                g_r = g_rects[i][j];
                 draw_in = PyList_New(0); // NOTE: ref[+10]
+                area = 0;
                 for (k = 0; k < n; k++) { // rs
                     r = (PyRectObject*) PyList_GET_ITEM(rs, k);
-                    // NOTE: ref[+11]
-                    r = (PyRectObject*)
-                        PyObject_CallMethodObjArgs(g_rect, clip, r, NULL);
-                    if (r->r.w > 0 && r->r.h > 0)
-                        PyList_Append(draw_in, (PyObject*) r);
-                    Py_DECREF(r); // NOTE: ref[-11]
+                    if (rect_clip(&g_r, &(r->r), &r_r)) {
+                        if (area == 0) bbox = r_r;
+                        else rect_union(&bbox, &r_r, &bbox);
+                        area += (long) r_r.w * r_r.h;
+                        // NOTE: ref[+11]
+                        r_o = rect_new(r_r.x, r_r.y, r_r.w, r_r.h);
+                        PyList_Append(draw_in, r_o);
+                        Py_DECREF(r_o); // NOTE: ref[-11]
+                    }
+                }
+                if (PyList_GET_SIZE(draw_in) > 1 &&
+                    area == (long) bbox.w * bbox.h) {
+                    // the rects are disjoint, so they exactly cover their
+                    // bounding box: draw that in one go instead
+                    rect_release_all(draw_in); // NOTE: ref[-10]
+                    draw_in = PyList_New(1); // NOTE: ref[+10]
+                    PyList_SET_ITEM(draw_in, 0,
+                                    rect_new(bbox.x, bbox.y, bbox.w, bbox.h));
                 }
                 if (PyList_GET_SIZE(draw_in) > 0) {
-                    PyObject_CallMethodObjArgs(g, draw, sfc, draw_in, NULL);
-                    if (PyErr_Occurred() != NULL) return NULL;
+                    // NOTE: ref[+11]
+                    r_o = PyObject_GetAttr(g, attrs[A_BLIT_DRAW]);
+                    if (r_o == Py_True) {
+                        if (!queue_blits(g, draw_in, blits, fblits))
+                            return NULL;
+                    } else {
+                        // draw anything queued first to keep the order
+                        if (!flush_blits(sfc, blits, fblits)) return NULL;
+                        PyObject_CallMethodObjArgs(g, draw, sfc, draw_in,
+                                                   NULL);
+                        if (PyErr_Occurred() != NULL) return NULL;
+                    }
+                    Py_DECREF(r_o); // NOTE: ref[-11]
                 }
-                Py_DECREF(draw_in); // NOTE: ref[-10]
-                Py_DECREF(g_rect); // NOTE: ref[-9]
+                rect_release_all(draw_in); // NOTE: ref[-10]
             }
-            Py_DECREF(tmp); // ref[-8]
-            tmp = PyList_New(0); // NOTE: ref[+8]
-            PyObject_SetAttrString(g, "_dirty", tmp);
-            Py_DECREF(tmp); // NOTE: ref[-8]
+            tmp = PyList_New(0); // NOTE: ref[+9]
+            PyObject_SetAttr(g, attrs[A_DIRTY], tmp);
+            Py_DECREF(tmp); // NOTE: ref[-9]
         }
     }
+    if (!flush_blits(sfc, blits, fblits)) return NULL;
+    Py_DECREF(blits); // NOTE: ref[-8]
 
-    // add up dirty rects to return
     Py_DECREF(rtn);
+    if (full) {
+        // already disjoint
+        rtn = PyList_GetSlice(dirty, 0, 1);
+        goto cleanup;
+    }
+    // add up dirty rects to return
     rtn = PyList_New(0);
     for (i = 0; i < n_layers; i++) { // dirty_by_layer
         tmp = rtn;
@@ -350,27 +741,38 @@ PyObject* fastdraw (PyObject* self, PyObject* args) {
         Py_DECREF(tmp); // NOTE: ref[-8]
     }
     // make all rects disjoint for faster display updating
-    tmp = PyList_New(0); // NOTE: ref[+8]
-    tmp2 = rtn;
-    rtn = mk_disjoint(tmp2, tmp); // NOTE: ref[+9]
-    Py_DECREF(tmp2); // NOTE: ref[-9]
+    tmp = rtn;
+    rtn = mk_disjoint(tmp, NULL); // NOTE: ref[+8]
     Py_DECREF(tmp); // NOTE: ref[-8]
 
+cleanup:
     // cleanup (in reverse order)
     Py_DECREF(draw); // NOTE: ref[-7]
     // NOTE: ref[-6]
-    for (i = 0; i < n_layers; i++) Py_DECREF(dirty_by_layer[i]);
-    PyMem_Free(dirty_by_layer); // NOTE: alloc[-4]
+    for (i = 0; i < n_layers; i++) {
+        // these are our own rects unless they're all just the passed list
+        if (full) Py_DECREF(dirty_by_layer[i]);
+        else rect_release_all(dirty_by_layer[i]);
+    }
+    PyMem_Free(d_live); // NOTE: alloc[-11]
+    PyMem_Free(dirty_by_layer); // NOTE: alloc[-10]
     Py_DECREF(dirty_opaque); // NOTE: ref[-5]
     Py_DECREF(opaque_in); // NOTE: ref[-4]
 end:
+    for (i = 0; i < n_layers; i++) {
+        PyMem_Free(g_vis[i]); // NOTE: alloc[-9]
+        PyMem_Free(g_opaque[i]); // NOTE: alloc[-8]
+        PyMem_Free(g_rects[i]); // NOTE: alloc[-7]
+    }
+    PyMem_Free(g_vis); // NOTE: alloc[-6]
+    PyMem_Free(g_opaque); // NOTE: alloc[-5]
+    PyMem_Free(g_rects); // NOTE: alloc[-4]
     for (i = 0; i < n_layers; i++) Py_DECREF(graphics_obj[i]); // NOTE: ref[-3]
     PyMem_Free(graphics); // NOTE: alloc[-3]
     PyMem_Free(n_graphics); // NOTE: alloc[-2]
     PyMem_Free(graphics_obj); // NOTE: alloc[-1]
     Py_DECREF(layers_in); // NOTE: ref[-2]
-    Py_DECREF(clip); // NOTE: ref[-1b]
-    Py_DECREF(pre_draw); // NOTE: ref[-1a]
+    Py_DECREF(pre_draw); // NOTE: ref[-1]
     return rtn;
 }
 
@@ -391,6 +793,7 @@ static struct PyModuleDef mod = {
 
 PyMODINIT_FUNC PyInit__gm (void) {
     import_pygame_rect();
+    if (!init_attrs()) return NULL;
     return PyModule_Create(&mod);
 }
 
@@ -400,6 +803,7 @@ PyMODINIT_FUNC PyInit__gm (void) {
 
 PyMODINIT_FUNC init_gm (void) {
     import_pygame_rect();
+    if (!init_attrs()) return;
     Py_InitModule("_gm", methods);
 }
 
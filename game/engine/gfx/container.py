@@ -18,9 +18,11 @@ TODO:
 """
 
 import sys
+from bisect import bisect_left
 
 import pygame as pg
 
+from ..conf import conf
 from .. import sched
 from ..util import ir, normalise_colour, blank_sfc, combine_drawn
 try:
@@ -31,6 +33,17 @@ except ImportError:
 from .graphic import Graphic
 from .graphics import Colour
 
+# graphic classes whose drawing flags have been worked out
+_flagged_classes = set()
+
+
+def _set_draw_flags (cls):
+    # tell fastdraw whether graphics of this class draw like Graphic does, from
+    # whether the methods are overridden, so subclasses needn't say
+    cls._blit_draw = cls._draw == Graphic._draw
+    cls._plain_opaque_in = cls._opaque_in == Graphic._opaque_in
+    _flagged_classes.add(cls)
+
 
 class GraphicsGroup (object):
     """Convenience wrapper for grouping a number of graphics in a simple way.
@@ -53,8 +66,9 @@ These can be set to apply to all contained graphics.
 
     #: Attributes which are mapped to
     #: :class:`Graphic <engine.gfx.graphic.Graphic>` attributes.
-    graphic_attrs = ('layer', 'visible', 'blit_flags', 'anchor', 'rot_anchor',
-                     'scale_fn', 'rotate_fn', 'rotate_threshold')
+    graphic_attrs = frozenset(('layer', 'visible', 'blit_flags', 'anchor',
+                               'rot_anchor', 'scale_fn', 'rotate_fn',
+                               'rotate_threshold'))
 
     def __init__ (self, x=0, y=0):
         self._pos = [x, y]
@@ -84,6 +98,7 @@ These can be set to apply to all contained graphics.
         self.rm(graphic)
 
     def __setattr__ (self, attr, val):
+        # called for every attribute set, so keep the test cheap
         if attr in self.graphic_attrs:
             for g in self:
                 setattr(g, attr, val)
@@ -97,16 +112,15 @@ These can be set to apply to all contained graphics.
 The top-left of this is not necessarily the same as :attr:`pos`.
 
 """
-        graphics = self._graphics.keys()
-        if graphics:
-            if len(graphics) == 1:
-                return graphics[0]._rect
+        # graphics can move independently, so this can't be cached
+        rects = [g._rect for g in self._graphics]
+        if rects:
+            if len(rects) == 1:
+                return rects[0]
             else:
-                return graphics[0]._rect.unionall(
-                    [g._rect for g in graphics[1:]]
-                )
+                return rects.pop().unionall(rects)
         else:
-            return pygame.Rect(0, 0, 0, 0)
+            return pg.Rect(0, 0, 0, 0)
 
     @property
     def x (self):
@@ -347,12 +361,43 @@ previous overlay from the :class:`GraphicsManager`.
             # add to this manager
             self.add(overlay)
 
-    def _set_layers_from_set (self, ls):
-        if None in ls:
-            ls.remove(None)
-            self.layers = [None] + sorted(ls)
+    def _layer_index (self, l):
+        # index of layer l in the sorted layers list, or where it belongs; None
+        # (the overlay) is always first, and is kept out of the bisection
+        # since it can't be compared with other layers in Python 3
+        if l is None:
+            return 0
+        layers = self.layers
+        return bisect_left(layers, l, 1 if layers and layers[0] is None else 0)
+
+    def _add_to_layer (self, g, l):
+        # add a graphic to the given layer, creating it if necessary
+        all_gs = self.graphics
+        if l in all_gs:
+            all_gs[l].add(g)
         else:
-            self.layers = sorted(ls)
+            all_gs[l] = set((g,))
+            self.layers.insert(self._layer_index(l), l)
+
+    def _rm_from_layer (self, g, l):
+        # remove a graphic from the given layer, removing the layer if empty
+        all_gs = self.graphics[l]
+        all_gs.remove(g)
+        if not all_gs:
+            del self.graphics[l]
+            # layers is sorted, so find it without comparing against every
+            # layer
+            self.layers.pop(self._layer_index(l))
+
+    def _move_layer (self, g, l):
+        # move a graphic to a different layer; called by Graphic.layer
+        self._rm_from_layer(g, g._layer)
+        # draw over previous location
+        if g.was_visible:
+            self.dirty(g._last_postrot_rect)
+        g._layer = l
+        self._add_to_layer(g, l)
+        g.was_visible = False
 
     def add (self, *graphics):
         """Add graphics.
@@ -361,21 +406,16 @@ Takes any number of :class:`Graphic <engine.gfx.graphic.Graphic>` instances,
 and returns a list of added graphics.
 
 """
-        all_gs = self.graphics
-        ls = set(self.layers)
         for g in graphics:
             l = g.layer
             if l is None and g is not self._overlay:
                 raise ValueError('a graphic\'s layer must not be None')
-            if l in ls:
-                all_gs[l].add(g)
-            else:
-                all_gs[l] = set((g,))
-                ls.add(l)
+            if type(g) not in _flagged_classes:
+                _set_draw_flags(type(g))
+            self._add_to_layer(g, l)
             g.own(self, lambda g, gm: self.rm(g))
             # don't draw over any possible previous location
             g.was_visible = False
-        self._set_layers_from_set(ls)
         return graphics
 
     def rm (self, *graphics):
@@ -386,24 +426,15 @@ Missing graphics are ignored.
 
 """
         all_graphics = self.graphics
-        ls = set(self.layers)
         for g in graphics:
             l = g.layer
-            if l in ls:
-                all_gs = all_graphics[l]
-                if g in all_gs:
-                    # remove from graphics
-                    all_gs.remove(g)
-                    g.release(self)
-                    # draw over previous location
-                    if g.was_visible:
-                        self.dirty(g._last_postrot_rect)
-                    # remove layer
-                    if not all_gs:
-                        del all_graphics[l]
-                        ls.remove(l)
+            if l in all_graphics and g in all_graphics[l]:
+                self._rm_from_layer(g, l)
+                g.release(self)
+                # draw over previous location
+                if g.was_visible:
+                    self.dirty(g._last_postrot_rect)
             # else not added: fail silently
-        self._set_layers_from_set(ls)
 
     def fade_to (self, t, colour=(0, 0, 0), resolution = None):
         """Fade to a colour.
@@ -496,12 +527,44 @@ persists; set :attr:`overlay` to ``None`` to remove it.
 
     def dirty (self, *rects):
         """:inherit:"""
-        if self._surface is None:
-            # nothing to mark as dirty
+        if self._surface is None or self._gm_dirty is True:
+            # nothing to mark as dirty, or already all dirty
             return
         if not rects:
-            rects = True
-        self._gm_dirty = combine_drawn(self._gm_dirty, rects)
+            self._gm_dirty = True
+            return
+        # coalesce as we go to keep the list passed to fastdraw small
+        dirty = self._gm_dirty or []
+        for r in rects:
+            # always copy, since the caller may go on to alter its rect, and
+            # this one may be returned from draw(); copy() is cheaper than
+            # building a Rect from one
+            r = r.copy() if type(r) is pg.Rect else pg.Rect(r)
+            if not r:
+                # zero-size
+                continue
+            # merge with rects that overlap or touch this one when the union
+            # covers no more than they do together (so nothing that isn't
+            # dirty gets redrawn; this includes rects covering or covered by
+            # it); collidelistall finds candidates in a single call
+            merged = True
+            while merged:
+                merged = False
+                for i in r.inflate(2, 2).collidelistall(dirty):
+                    d = dirty[i]
+                    u = d.union(r)
+                    c = d.clip(r)
+                    if (u[2] * u[3] <=
+                        d[2] * d[3] + r[2] * r[3] - c[2] * c[3]):
+                        # r has grown, so check again
+                        del dirty[i]
+                        r = u
+                        merged = True
+                        break
+            dirty.append(r)
+        if len(dirty) > conf.MAX_DIRTY_RECTS:
+            dirty = [dirty[0].unionall(dirty[1:])]
+        self._gm_dirty = dirty
 
     def draw (self, handle_dirty = True):
         """Update the display (:attr:`orig_sfc`).
@@ -523,11 +586,22 @@ changed parts of the surface, or ``False`` if nothing changed.
         graphics = self.graphics
         dirty = self._gm_dirty
         self._gm_dirty = []
-        if dirty is True:
-            dirty = [sfc.get_rect()]
-        elif dirty is False:
+        full = True
+        if dirty is False:
             dirty = []
-        dirty = fastdraw(layers, sfc, graphics, dirty)
+            full = False
+        elif dirty is not True and (sum(r[2] * r[3] for r in dirty) <
+                                    conf.FULL_REDRAW_RATIO *
+                                    sfc.get_width() * sfc.get_height()):
+            full = False
+        # else cheaper to redraw everything than to make the rects disjoint
+        # (dirty rects are merged as they're added, so the sum of their areas
+        # is close to the area they cover, and there are never more than
+        # MAX_DIRTY_RECTS)
+        if full:
+            # fastdraw skips all rect handling in this case
+            dirty = [sfc.get_rect()]
+        dirty = fastdraw(layers, sfc, graphics, dirty, full)
         if dirty and handle_dirty:
             Graphic.dirty(self, *dirty)
         if self._orig_dirty:
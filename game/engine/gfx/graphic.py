@@ -23,6 +23,16 @@ from ..conf import conf
 from ..util import (ir, pos_in_rect, align_rect, normalise_colour, has_alpha,
                     blank_sfc, combine_drawn, Owned)
 
+# Surface.blits is new in Pygame 1.9.4
+_have_blits = hasattr(pg.Surface, 'blits')
+# for slicing rects by index
+_rect_indices = (0, 1, 2, 3)
+
+
+def _rotozoom (sfc, angle, _deg_per_rad=180 / pi):
+    # default Graphic.rotate_fn, shared by all instances
+    return pg.transform.rotozoom(sfc, angle * _deg_per_rad, 1)
+
 
 class Graphic (Owned):
     """Something that can be drawn to the screen.
@@ -62,6 +72,27 @@ correspond to builtin transforms (see :meth:`transform`).
 
     is_view = False
     _builtin_transforms = ('crop', 'flip', 'tint', 'resize', 'rotate')
+    # whether _draw just blits the surface, so that the manager may batch it
+    # with other graphics' blits; GraphicsManager sets this for each class it
+    # sees, from whether _draw is overridden
+    _blit_draw = True
+    # whether _opaque_in is just opaque and within _postrot_rect, so that the
+    # manager may work it out itself; set like _blit_draw, from whether
+    # _opaque_in is overridden
+    _plain_opaque_in = True
+    # attributes every graphic has, stored compactly (instances still get a
+    # __dict__ from Owned, for anything else)
+    __slots__ = (
+        '_resource_pool', '_resource_manager', 'fn', '_orig_sfc', '_surface',
+        '_postrot_rect', '_rect', '_x', '_y', '_w', '_h', '_last_postrot_rect',
+        'last_rect', '_anchor', '_rot_anchor', '_rot_offset', '_must_apply_rot',
+        'transforms', '_last_transforms', '_transforms', '_queued_transforms',
+        'opaque', '_layer', '_last_blit_flags', 'blit_flags', 'visible',
+        'was_visible', '_scale', '_cropped_rect', '_flipped', '_tint_colour',
+        '_angle', '_scale_fn', '_resize_cache', '_alpha_cache', '_rotate_fn',
+        '_rotate_threshold', '_rotate_cache', '_rot_trig', '_crop_opaque',
+        '_orig_dirty', '_dirty', '_cbs', '_evts'
+    )
 
     def __init__ (self, img, pos=(0, 0), layer=0,
                   pool=conf.DEFAULT_RESOURCE_POOL, res_mgr=None):
@@ -78,9 +109,12 @@ correspond to builtin transforms (see :meth:`transform`).
         self._orig_sfc = self._surface = img
         # postrot is the rect drawn in
         self._postrot_rect = self._rect = Rect(pos, img.get_size())
-        self._last_postrot_rect = Rect(self._postrot_rect)
-        #: :attr:`rect` at the time of the last draw.
-        self.last_rect = Rect(self._rect)
+        # components of _rect, kept in sync with it for cheap access
+        self._x, self._y, self._w, self._h = self._rect
+        self._last_postrot_rect = self._postrot_rect.copy()
+        #: :attr:`rect` at the time of the last draw.  This may be the same
+        #: object as :attr:`rect`, which is never altered in place.
+        self.last_rect = self._rect
         self._anchor = (0, 0)
         self._rot_anchor = 'center'
         self._rot_offset = (0, 0) # postrot_pos = pos + rot_offset
@@ -115,9 +149,19 @@ correspond to builtin transforms (see :meth:`transform`).
         self._tint_colour = (255, 255, 255, 255)
         self._angle = 0
         self._scale_fn = pg.transform.smoothscale
-        self._rotate_fn = lambda sfc, angle: \
-            pg.transform.rotozoom(sfc, angle * 180 / pi, 1)
+        # [(src, size, sfc)] for recent resizes, most recent first
+        self._resize_cache = []
+        # {transform: (src, converted)} for transforms that need alpha
+        self._alpha_cache = {}
+        self._rotate_fn = _rotozoom
         self._rotate_threshold = 2 * pi / 500
+        # [(src, step, sfc)] for recent rotations, most recent first, where
+        # step is the angle in multiples of rotate_threshold
+        self._rotate_cache = []
+        # (angle, sin(angle), cos(angle)) for the last rotation offset
+        self._rot_trig = (0, 0., 1.)
+        # (src, opaque) for the last surface cropped
+        self._crop_opaque = (None, False)
         self._orig_dirty = False # where original surface is changed
         # where final surface is changed; gets used (and reset) by manager
         self._dirty = []
@@ -127,23 +171,27 @@ correspond to builtin transforms (see :meth:`transform`).
         self._evts = {}
 
     def __getitem__ (self, i):
-        if isinstance(i, slice):
+        try:
+            return self._rect[i]
+        except TypeError:
+            if not isinstance(i, slice):
+                raise
             # Rect is weird and only accepts slices through slice syntax
             # this is the easiest way around it (and slicing doesn't work with
             # Python 3 anyway)
             r = self._rect
-            return [r[i] for i in range(4)[i]]
-        else:
-            return self._rect[i]
+            return [r[i] for i in _rect_indices[i]]
 
     def __setitem__ (self, i, v):
-        r = Rect(self._rect)
         if isinstance(i, slice):
-            for v_i, r_i in enumerate(range(4)[i]):
+            r = [self._x, self._y, self._w, self._h]
+            for v_i, r_i in enumerate(_rect_indices[i]):
                 r[r_i] = v[v_i]
-        else:
+            self.rect = r
+        elif self._rect[i] != v:
+            r = [self._x, self._y, self._w, self._h]
             r[i] = v
-        self.rect = r
+            self.rect = r
 
     @property
     def orig_sfc (self):
@@ -190,74 +238,85 @@ really.  To get the real rect, use :attr:`postrot_rect`.
 
     @rect.setter
     def rect (self, rect):
-        # need to set dirty in old and new rects (if changed)
-        rect = Rect(rect)
+        # often set to the current value, so check for that without
+        # creating a Rect
+        if type(rect) in (Rect, tuple, list) and len(rect) == 4:
+            x, y, w, h = rect
+            if x == self._x and y == self._y and w == self._w and h == self._h:
+                return
         old_rect = self._rect
-        self._rect = Rect(rect.topleft, self._rect.size)
+        if type(rect) is Rect:
+            if rect == old_rect:
+                return
+            # only read from, so no need to copy an existing Rect
+            new_rect = Rect(rect.topleft, old_rect.size)
+        else:
+            rect = Rect(rect)
+            if rect == old_rect:
+                return
+            # this Rect is our own, so keep it if we can
+            if rect.size == old_rect.size:
+                new_rect = rect
+            else:
+                new_rect = Rect(rect.topleft, old_rect.size)
+        self._x, self._y, self._w, self._h = self._rect = new_rect
         if rect.size != old_rect.size:
             self.resize(*rect.size)
 
     @property
     def x (self):
         """``x`` co-ordinate of the top-left corner of :attr:`rect`."""
-        return self._rect[0]
+        return self._x
 
     @x.setter
     def x (self, x):
-        r = Rect(self._rect)
-        r[0] = x
-        self.rect = r
+        self.rect = (x, self._y, self._w, self._h)
 
     @property
     def y (self):
         """``y`` co-ordinate of the top-left corner of :attr:`rect`."""
-        return self._rect[1]
+        return self._y
 
     @y.setter
     def y (self, y):
-        r = Rect(self._rect)
-        r[1] = y
-        self.rect = r
+        self.rect = (self._x, y, self._w, self._h)
 
     @property
     def pos (self):
         """``(``:attr:`x` ``,`` :attr:`y` ``)``."""
-        return self._rect.topleft
+        return (self._x, self._y)
 
     @pos.setter
     def pos (self, pos):
-        self.rect = (pos, self._rect.size)
+        if pos[0] != self._x or pos[1] != self._y:
+            self.rect = (pos[0], pos[1], self._w, self._h)
 
     @property
     def w (self):
         """Width of :attr:`rect`; uses :meth:`resize`."""
-        return self._rect[2]
+        return self._w
 
     @w.setter
     def w (self, w):
-        r = Rect(self._rect)
-        r[2] = w
-        self.rect = r
+        self.rect = (self._x, self._y, w, self._h)
 
     @property
     def h (self):
         """Height of :attr:`rect`; uses :meth:`resize`."""
-        return self._rect[3]
+        return self._h
 
     @h.setter
     def h (self, h):
-        r = Rect(self._rect)
-        r[3] = h
-        self.rect = r
+        self.rect = (self._x, self._y, self._w, h)
 
     @property
     def size (self):
         """``(``:attr:`w` ``,`` :attr:`h` ``)``."""
-        return self._rect.size
+        return (self._w, self._h)
 
     @size.setter
     def size (self, size):
-        self.rect = (self._rect.topleft, size)
+        self.rect = (self._x, self._y, size[0], size[1])
 
     @property
     def scale_x (self):
@@ -419,6 +478,7 @@ signature as this default).
     @scale_fn.setter
     def scale_fn (self, scale_fn):
         self._scale_fn = scale_fn
+        self._resize_cache = []
         self.retransform('resize')
 
     @property
@@ -434,6 +494,7 @@ passed to :meth:`rotate`) and returns the new rotated surface.
     @rotate_fn.setter
     def rotate_fn (self, rotate_fn):
         self._rotate_fn = rotate_fn
+        self._rotate_cache = []
         self.retransform('rotate')
 
     @property
@@ -446,6 +507,7 @@ Defaults to ``2 * pi / 500``."""
     @rotate_threshold.setter
     def rotate_threshold (self, rotate_threshold):
         self._rotate_threshold = rotate_threshold
+        self._rotate_cache = []
         self.retransform('rotate')
 
     # other properties
@@ -473,8 +535,12 @@ This property may be changed directly.
     @layer.setter
     def layer (self, layer):
         if layer != self._layer:
-            # change layer in gm by removing, setting attribute, then adding
             m = self.owner
+            if hasattr(m, '_move_layer'):
+                # GraphicsManager can move us without a full rm/add
+                m._move_layer(self, layer)
+                return
+            # change layer in owner by removing, setting attribute, then adding
             if hasattr(m, 'rm'):
                 m.rm(self)
             self._layer = layer
@@ -491,12 +557,8 @@ move_to([x][, y]) -> self
 Omitted arguments are unchanged.
 
 """
-        r = Rect(self._rect)
-        if x is not None:
-            r[0] = x
-        if y is not None:
-            r[1] = y
-        self.rect = r
+        self.rect = (self._x if x is None else x, self._y if y is None else y,
+                     self._w, self._h)
         return self
 
     def move_by (self, dx = 0, dy = 0):
@@ -505,7 +567,8 @@ Omitted arguments are unchanged.
 move_by(dx = 0, dy = 0) -> self
 
 """
-        self.rect = self._rect.move(dx, dy)
+        if dx or dy:
+            self.rect = (self._x + dx, self._y + dy, self._w, self._h)
         return self
 
     def align (self, alignment = 0, pad = 0, offset = 0, within = None):
@@ -762,16 +825,27 @@ If creating and returning a new surface, it should already be converted for
 blitting.
 
 """
-        old_final_size = self._rect.size
-
-        # add to/reorder transforms list, and queue for transforming later
         t_ks = self.transforms
         q = self._queued_transforms
         ts = self._transforms
+        if not kwargs and isinstance(transform_fn, basestring):
+            # builtins do nothing when given the same arguments again, so
+            # don't bother undoing and reapplying modifiers (resize is often
+            # called with an unchanged size)
+            data = q.get(transform_fn)
+            if data is None:
+                data = ts.get(transform_fn)
+            if data is not None and data[0] == args:
+                return self
+        old_final_size = self._rect.size
+
+        # add to/reorder transforms list, and queue for transforming later
+        builtin = isinstance(transform_fn, basestring)
         exists = True
         try:
             last_index = t_ks.index(transform_fn)
         except ValueError:
+            last_index = None
             exists = False
         else:
             if transform_fn in q:
@@ -784,8 +858,10 @@ blitting.
                 old_data = self.untransform(transform_fn)
                 if old_data is not None:
                     ts[transform_fn] = old_data
-            if transform_fn in t_ks:
-                # has to be a builtin: untransform won't remove it
+            if builtin or not exists:
+                # untransform doesn't remove builtins (and has removed
+                # anything else it was called for), so it's still at the same
+                # index
                 t_ks.pop(last_index)
         # determine index
         i = kwargs.get('position')
@@ -805,7 +881,6 @@ blitting.
         if i is None:
             i = last_index if last_index is not None else len(t_ks)
         # generate modifiers
-        builtin = isinstance(transform_fn, basestring)
         if builtin:
             src_sz = self.sz_before_transform(i)
             gen_mods = getattr(self, '_gen_mods_' + transform_fn)
@@ -923,7 +998,8 @@ is determined by :attr:`anchor`.
         old_ox, old_oy = pos_in_rect(self.anchor, self._rect)
         new_ox, new_oy = pos_in_rect(self.anchor, size)
         x, y = self._rect.topleft
-        self._rect = Rect((x + old_ox - new_ox, y + old_oy - new_oy), size)
+        self._x, self._y, self._w, self._h = self._rect = \
+            Rect((x + old_ox - new_ox, y + old_oy - new_oy), size)
         if got_transforms:
             self._apply_transforms(0, True)
 
@@ -950,6 +1026,16 @@ If successful, all transformations are reapplied afterwards, if any.
             # this calls a setter
             self.orig_sfc = self._load_img(self.fn, True)
 
+    def _convert_alpha (self, transform_fn, src, dirty):
+        # src.convert_alpha(), reusing the last result for this transform if
+        # src hasn't changed since then
+        cached = self._alpha_cache.get(transform_fn)
+        if not dirty and cached is not None and cached[0] is src:
+            return cached[1]
+        sfc = src.convert_alpha()
+        self._alpha_cache[transform_fn] = (src, sfc)
+        return sfc
+
     def _gen_mods_resize (self, src_sz, first_time, last_args, w, h,
                           scale=False):
         # mods are size-dependent, so they always change
@@ -974,12 +1060,12 @@ If successful, all transformations are reapplied afterwards, if any.
         def apply_fn (g):
             g._scale = scale
             x, y = g._rect.topleft
-            g._rect = Rect(x + ox, y + oy, w, h)
+            g._x, g._y, g._w, g._h = g._rect = Rect(x + ox, y + oy, w, h)
 
         def undo_fn (g):
             g._scale = (1, 1)
             x, y = g._rect.topleft
-            g._rect = Rect(x - ox, y - oy, ow, oh)
+            g._x, g._y, g._w, g._h = g._rect = Rect(x - ox, y - oy, ow, oh)
 
         return ((apply_fn, undo_fn), (w, h))
 
@@ -1022,8 +1108,20 @@ If successful, all transformations are reapplied afterwards, if any.
             # transform does nothing
             return (src, new_dirty if last_args is None else True)
 
+        cache = self._resize_cache
+        if dirty:
+            # src changed, so previous results are out of date
+            del cache[:]
+        else:
+            # reuse a recent result if resizing back to the same size
+            for c_src, c_sz, c_sfc in cache:
+                if c_src is src and c_sz == (w, h):
+                    return (c_sfc, True)
         # full transform
-        return (self.scale_fn(src, (w, h)), new_dirty)
+        sfc = self.scale_fn(src, (w, h))
+        cache.insert(0, (src, (w, h), sfc))
+        del cache[2:]
+        return (sfc, new_dirty)
 
     def resize (self, w=None, h=None, scale=False):
         """Resize the graphic.
@@ -1047,6 +1145,11 @@ rescale(w=1, h=1) -> self
 :arg h: the new height; ratio of the height before scaling.
 
 """
+        if (w == h == 1 and 'resize' not in self._queued_transforms and
+            'resize' not in self._transforms):
+            # never resized, and still not (resizing with the same arguments
+            # is caught by transform)
+            return self
         return self.resize(None, None, (w, h))
 
     def resize_both (self, w=False, h=False):
@@ -1078,11 +1181,13 @@ rescale_both(scale=1) -> self
         if first_time or Rect(last_args[0]) != rect:
 
             def apply_fn (g):
-                g._rect = g._rect.move(rect.x, rect.y)
+                g._x, g._y, g._w, g._h = g._rect = \
+                    g._rect.move(rect.x, rect.y)
                 g._cropped_rect = rect
 
             def undo_fn (g):
-                g._rect = g._rect.move(-rect.x, -rect.y)
+                g._x, g._y, g._w, g._h = g._rect = \
+                    g._rect.move(-rect.x, -rect.y)
                 g._cropped_rect = None
 
             mods = (apply_fn, undo_fn)
@@ -1100,13 +1205,19 @@ rescale_both(scale=1) -> self
                     # clip dirty rects inside cropped rect; if there's a
                     # border, it remains empty as before, so isn't dirtied
                     new_dirty = []
+                    blits = []
                     offset = (-rect.x, -rect.y)
-                    for r in dirty:
-                        r = r.clip(rect)
-                        if r:
-                            s = r.move(offset)
-                            new_dirty.append(s)
-                            dest.blit(src, s, r)
+                    # collidelistall skips the rects outside in a single call
+                    for i in rect.collidelistall(dirty):
+                        r = dirty[i].clip(rect)
+                        s = r.move(offset)
+                        new_dirty.append(s)
+                        blits.append((src, s, r))
+                    if _have_blits:
+                        dest.blits(blits, False)
+                    else:
+                        for b in blits:
+                            dest.blit(*b)
                     return (dest, new_dirty)
                 else:
                     return (dest, False)
@@ -1115,8 +1226,12 @@ rescale_both(scale=1) -> self
             # no cropping occurs
             return (src, dirty if last_args is None else True)
 
-        # do a full transform
-        if start.contains(rect) and not has_alpha(src):
+        # do a full transform; the source's opacity only needs checking when it
+        # changes, not every time the crop rect moves
+        src_opaque = self._crop_opaque
+        if dirty is True or src_opaque[0] is not src:
+            self._crop_opaque = src_opaque = (src, not has_alpha(src))
+        if src_opaque[1] and start.contains(rect):
             new_sfc = pg.Surface(rect.size)
         else:
             # not (no longer) opaque
@@ -1192,7 +1307,13 @@ flip(x = False, y = False) -> self
 :arg y: whether to flip over the y-axis.
 
 """
-        return self.transform('flip', bool(x), bool(y))
+        x = bool(x)
+        y = bool(y)
+        if (not x and not y and 'flip' not in self._queued_transforms and
+            'flip' not in self._transforms):
+            # never flipped, and still not
+            return self
+        return self.transform('flip', x, y)
 
     def _gen_mods_tint (self, src_sz, first_time, last_args, colour):
         colour = normalise_colour(colour)
@@ -1221,7 +1342,7 @@ flip(x = False, y = False) -> self
 
         # full transform
         if not has_alpha(src):
-            src = src.convert_alpha()
+            src = self._convert_alpha('tint', src, dirty)
         new_sfc = pg.Surface(src.get_size()).convert_alpha()
         new_sfc.fill(colour)
         if colour[3] > 0:
@@ -1280,12 +1401,29 @@ opacify(opacity) -> self
             # transform does nothing
             return (src, dirty if last_args is None else True)
 
+        # reuse a recent result if rotating back to within the threshold of
+        # the same angle
+        threshold = self.rotate_threshold
+        step = ir(angle / threshold) if threshold > 0 else angle
+        cache = self._rotate_cache
+        if dirty:
+            # src changed, so previous results are out of date
+            del cache[:]
+        else:
+            for i, (c_src, c_step, c_sfc) in enumerate(cache):
+                if c_src is src and c_step == step:
+                    cache.insert(0, cache.pop(i))
+                    return (c_sfc, True)
+
         # do a full transform
         # if not already alpha and we might end up with borders, convert to
         # alpha
+        orig_src = src
         if angle % (pi / 2) != 0 and not has_alpha(src):
-            src = src.convert_alpha()
+            src = self._convert_alpha('rotate', src, dirty)
         new_sfc = self.rotate_fn(src, angle)
+        cache.insert(0, (orig_src, step, new_sfc))
+        del cache[conf.ROTATE_CACHE_SIZE:]
         return (new_sfc, True)
 
     def rotate (self, angle):
@@ -1350,7 +1488,8 @@ This may not be used on subclasses that define a ``child`` property.
         class GraphicView (parent_cls):
             is_view = True
             _faked_attrs = (
-                '_rect', 'last_rect', '_postrot_rect', '_last_postrot_rect',
+                '_rect', '_x', '_y', '_w', '_h', 'last_rect', '_postrot_rect',
+                '_last_postrot_rect',
                 'visible', 'was_visible', '_layer',
                 # Owned
                 'max_owners', '_on_full', '_owners'
@@ -1371,9 +1510,11 @@ This may not be used on subclasses that define a ``child`` property.
 
             def __setattr__ (self, attr, val):
                 # set on this instance if this is an outer attribute or a
-                # property, else set on the contained graphic
+                # property, else set on the contained graphic (slots are
+                # class attributes, but belong to the graphic)
                 if (attr == 'child' or attr in self._faked_attrs or
-                    hasattr(type(self.child), attr)):
+                    (hasattr(type(self.child), attr) and
+                     attr not in Graphic.__slots__)):
                     parent_cls.__setattr__(self, attr, val)
                 else:
                     setattr(self.child, attr, val)
@@ -1388,7 +1529,9 @@ not alter any other (transformed) surfaces.  Takes any number of rects to flag
 as dirty.  If none are given, the whole of the graphic is flagged.
 
 """
-        dirty = [Rect(r) for r in rects] if rects else True
+        # copy rects, since the caller may go on to alter them
+        dirty = ([r.copy() if type(r) is Rect else Rect(r) for r in rects]
+                 if rects else True)
         self._orig_dirty = combine_drawn(self._orig_dirty, dirty)
         self._call_cbs('draw orig')
 
@@ -1402,24 +1545,32 @@ surface.
         t_ks = self.transforms
         last_t_ks = self._last_transforms
         q = self._queued_transforms
+        dirty = self._orig_dirty
+        if (not q and not dirty and not self._must_apply_rot and
+            t_ks == last_t_ks):
+            # nothing changed (the usual case, since this is called before
+            # every draw)
+            return
         ts = self._transforms
         self._queued_transforms = {}
         # work out where to start (re)applying transforms from
-        dirty = self._orig_dirty
         self._orig_dirty = False
         if dirty:
             i = 0
         elif q:
-            i = min(t_ks.index(fn) for fn in q)
-            i = min(i, *(last_t_ks.index(fn) for fn in q if fn in last_t_ks))
+            # first queued transform, in either order; one pass over each list
+            # rather than an index() scan per queued transform
+            i = next(j for j, fn in enumerate(t_ks) if fn in q)
+            i = next((j for j, fn in enumerate(last_t_ks[:i]) if fn in q), i)
         else:
             i = len(t_ks)
         # apply transforms
         orig_final_sfc = self._surface
         before_rot = sfc = self._orig_sfc
         passed_rot = False
+        n_last = len(last_t_ks)
         for j, fn in enumerate(t_ks):
-            if fn != last_t_ks[j]:
+            if j >= n_last or fn != last_t_ks[j]:
                 # differ from last transform order at this point
                 dirty = True
                 i = j
@@ -1477,8 +1628,13 @@ surface.
             vx = w_orig / 2. - ax
             vy = h_orig / 2. - ay
             # c_new - about_new = v.rotate(angle)
-            s = sin(angle)
-            c = cos(angle)
+            trig = self._rot_trig
+            if trig[0] != angle:
+                # new angle (the offset is also recomputed when only the size
+                # changes)
+                self._rot_trig = trig = (angle, sin(angle), cos(angle))
+            s = trig[1]
+            c = trig[2]
             ax_new = w / 2. - (c * vx + s * vy)
             ay_new = h / 2. - (-s * vx + c * vy)
             # about = offset + about_new
@@ -1489,8 +1645,13 @@ surface.
             self._surface = sfc
             self.opaque = not has_alpha(sfc)
             self._rect = r = Rect(self._rect.topleft, before_rot.get_size())
-            self._postrot_rect = pr = r.move(self._rot_offset)
-            pr.size = sfc.get_size()
+            self._x, self._y, self._w, self._h = r
+            ox, oy = self._rot_offset
+            w, h = sfc.get_size()
+            if ox == oy == 0 and w == r[2] and h == r[3]:
+                self._postrot_rect = r
+            else:
+                self._postrot_rect = Rect(r[0] + ox, r[1] + oy, w, h)
             if sfc != orig_final_sfc:
                 self._call_cbs('change', orig_final_sfc, sfc)
             else:
@@ -1502,15 +1663,27 @@ surface.
 drawing."""
         self.render()
         dirty = self._dirty
-        if self._rect != self.last_rect:
+        r = self._rect
+        # rect is replaced when changed, so it's usually still last_rect
+        if r is not self.last_rect and r != self.last_rect:
             dirty = True
-            self._postrot_rect = Rect(
-                self._rect.move(self._rot_offset).topleft,
-                self._postrot_rect.size
-            )
+            ox, oy = self._rot_offset
+            w, h = self._postrot_rect.size
+            if ox == oy == 0 and w == self._w and h == self._h:
+                # not rotated: same as the rect, which is never altered in
+                # place
+                self._postrot_rect = r
+            else:
+                self._postrot_rect = Rect(self._x + ox, self._y + oy, w, h)
         if self.blit_flags != self._last_blit_flags:
             dirty = True
             self._last_blit_flags = self.blit_flags
+        if not (self.visible and self.was_visible):
+            # the manager redraws all of the graphic when visibility changes,
+            # and ignores dirty rects while it stays hidden
+            if self._dirty:
+                self._dirty = []
+            return
         # fastdraw needs dirty to be a list
         if dirty:
             pr = self._postrot_rect
@@ -1536,11 +1709,19 @@ Should never alter any state that is not internal to the graphic.
 
 """
         sfc = self._surface
-        blit = dest.blit
         pr = self._postrot_rect
         offset = (-pr[0], -pr[1])
-        for r in rects:
-            blit(sfc, r, r.move(offset), self.blit_flags)
+        flags = self.blit_flags
+        if len(rects) == 1 and rects[0] == pr:
+            # drawing all of it: no need for an area
+            dest.blit(sfc, pr, None, flags)
+        elif _have_blits:
+            # one call for all rects
+            dest.blits([(sfc, r, r.move(offset), flags) for r in rects], False)
+        else:
+            blit = dest.blit
+            for r in rects:
+                blit(sfc, r, r.move(offset), flags)
         self._last_postrot_rect = pr
         self.last_rect = self._rect
 
@@ -59,6 +59,12 @@ Colour(colour, rect, layer=0)
         # converts surface and sets opaque to True
         Graphic.__init__(self, pg.Surface(rect.size), rect.topleft, layer)
         self._colour = (0, 0, 0, 255)
+        # the surface last filled, kept to fill again after filling with
+        # black, which just uses the original surface
+        self._fill_sfc = None
+        # (surface, colour) if the surface last filled is an opaque colour, so
+        # that drawing it can just fill while it's the final surface
+        self._plain_fill = None
         self.fill(colour)
 
     @property
@@ -89,13 +95,19 @@ Colour(colour, rect, layer=0)
         colour = gameutil.normalise_colour(colour)
         if colour == (0, 0, 0, 255):
             return (src, dirty)
+        refill = dirty is True
+        if dest is None or dest is src:
+            # not filled last time, so dest (if any) is the original surface,
+            # which must not be filled
+            dest = self._fill_sfc
+            refill = True
         if dest is not None and src.get_size() == dest.get_size():
             # we can reuse dest
-            last_colour = gameutil.normalise_colour(last_args[0])
             if colour[3] < 255 and not gameutil.has_alpha(dest):
                 # newly transparent
-                dest = dest.convert_alpha()
-            if dirty is True or last_colour != colour:
+                self._fill_sfc = dest = dest.convert_alpha()
+            self._plain_fill = (dest, colour) if colour[3] == 255 else None
+            if refill or gameutil.normalise_colour(last_args[0]) != colour:
                 # need to refill everything
                 dest.fill(colour)
                 return (dest, True)
@@ -115,14 +127,35 @@ Colour(colour, rect, layer=0)
         else:
             new_sfc = new_sfc.convert()
         new_sfc.fill(colour)
+        self._fill_sfc = new_sfc
+        self._plain_fill = (new_sfc, colour) if colour[3] == 255 else None
         return (new_sfc, True)
 
     def fill (self, colour):
         """Fill with the given colour (like :attr:`colour`)."""
-        self.transform('fill', colour)
+        # normalise once here, so that the same colour in any form is seen as
+        # unchanged, and the transform only compares tuples
+        self.transform('fill', gameutil.normalise_colour(colour))
         self._colour = colour
         return self
 
+    def _draw (self, dest, rects):
+        plain = self._plain_fill
+        if plain is None or plain[0] is not self._surface or self.blit_flags:
+            # not just an opaque rect of a single colour: the final surface
+            # must be the one filled, which later transforms (that never alter
+            # their source) can only pass on unchanged
+            Graphic._draw(self, dest, rects)
+            return
+        # filling is cheaper than blitting; map the colour for dest once rather
+        # than in every fill
+        c = dest.map_rgb(plain[1])
+        fill = dest.fill
+        for r in rects:
+            fill(c, r)
+        self._last_postrot_rect = self._postrot_rect
+        self.last_rect = self._rect
+
 
 class Text (Graphic):
     """Graphic displaying rendered text.
@@ -32,9 +32,11 @@ dd(default[, items], **kwargs) -> default_dict
 :return: the created ``defaultdict``.
 
 """
-    items = items.copy()
-    items.update(kwargs)
-    return defaultdict(lambda: default, items)
+    # defaultdict copies items itself, so they never need copying here
+    d = defaultdict(lambda: default, items)
+    if kwargs:
+        d.update(kwargs)
+    return d
 
 
 def ir (x):
@@ -106,6 +108,10 @@ colour in a string (``'#rgb'``, ``'#rrggbb'``, ``'#rgba'``, ``'#rrggbbaa'``
 - or without the leading ``'#'``).
 
 """
+    if type(c) is tuple and len(c) == 4:
+        # already normalised (the common case, since results get passed back
+        # in)
+        return c
     if isinstance(c, int):
         a = c % 256
         c >>= 8
@@ -432,13 +438,21 @@ align_rect(rect, within, alignment = 0, pad = 0, offset = 0) -> pos
     within = list(within.inflate(-2 * pad[0], -2 * pad[1]))
     for axis in (0, 1):
         align = pos[axis]
+        o = offset[axis]
         if align < 0:
             x = 0
         elif align == 0:
+            if isinstance(o, int):
+                # stick to integers: rect values always are, and this rounds
+                # halves away from zero like ir
+                t = 2 * (within[axis] + o) + within[2 + axis] - sz[axis]
+                pos[axis] = (t + (t > 0)) >> 1
+                continue
             x = (within[2 + axis] - sz[axis]) / 2.
         else: # align > 0
             x = within[2 + axis] - sz[axis]
-        pos[axis] = ir(within[axis] + x + offset[axis])
+        x += within[axis] + o
+        pos[axis] = x if isinstance(o, int) else ir(x)
     return pos
 
 
@@ -485,7 +499,11 @@ These are as returned by :meth:`engine.game.World.draw`.
 """
     if True in drawn:
         return True
-    rects = sum((list(d) for d in drawn if d), [])
+    # build one list rather than summing (which copies for every argument)
+    rects = []
+    for d in drawn:
+        if d:
+            rects.extend(d)
     return rects if rects else False
 
 
@@ -8,8 +8,6 @@ if os.name == 'nt':
 from game import engine, EntryWorld
 
 if __name__ == '__main__':
-    engine.init()
-
     args = []
     if len(argv) > 1:
         # got some command-line arguments
@@ -34,21 +32,23 @@ if __name__ == '__main__':
         # debug
         engine.conf.DEBUG = options.debug
         # construct world args
-        # run game
+        # run game (initialising only now, so that -h or bad arguments don't
+        # start up pygame)
+        engine.init()
         if options.profile:
-            from cProfile import run
+            from cProfile import Profile
             from pstats import Stats
-            args = ', '.join(repr(arg) for arg in args)
-            if args:
-                args += ', '
-            code = 'engine.game.run(EntryWorld, {0}t = options.time)'
-            run(code.format(args), options.profile_file, locals())
+            prof = Profile()
+            prof.runcall(engine.game.run, EntryWorld, *args,
+                         t = options.time)
+            prof.dump_stats(options.profile_file)
             Stats(options.profile_file).strip_dirs() \
                 .sort_stats(options.sort_stats).print_stats(options.num_stats)
             os.unlink(options.profile_file)
         else:
             engine.game.run(EntryWorld, *args, t = options.time)
     else:
+        engine.init()
         engine.game.run(EntryWorld, *args)
 
     engine.quit()
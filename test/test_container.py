@@ -0,0 +1,146 @@
+import os
+import unittest
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+import pygame as pg
+
+from game.engine import sched
+from game.engine.gfx import GraphicsManager, Graphic, Colour
+
+
+class LayersTest (unittest.TestCase):
+    def setUp (self):
+        pg.display.init()
+        pg.display.set_mode((20, 20))
+        self.gm = GraphicsManager(sched.Scheduler(), pg.Surface((20, 20)))
+
+    def tearDown (self):
+        pg.display.quit()
+
+    def colour (self, layer=0):
+        return Colour((255, 0, 0), (5, 5), layer)
+
+    def test_overlay_with_layers (self):
+        # the overlay's layer is None, which must stay first and never be
+        # compared with other layers
+        gm = self.gm
+        gm.add(self.colour(1), self.colour(-2))
+        gm.overlay = self.colour()
+        self.assertEqual(gm.layers, [None, -2, 1])
+        gm.add(self.colour(0))
+        self.assertEqual(gm.layers, [None, -2, 0, 1])
+        gm.draw()
+        # replacing removes the old overlay's layer first
+        gm.overlay = self.colour()
+        self.assertEqual(gm.layers, [None, -2, 0, 1])
+        gm.overlay = None
+        self.assertEqual(gm.layers, [-2, 0, 1])
+
+    def test_move_layer_with_overlay (self):
+        gm = self.gm
+        g = self.colour(3)
+        gm.add(g, self.colour(1))
+        gm.overlay = self.colour()
+        g.layer = -1
+        self.assertEqual(gm.layers, [None, -1, 1])
+
+
+    def test_dirty_copies_rects (self):
+        gm = self.gm
+        r = pg.Rect(1, 2, 3, 4)
+        gm.dirty(r)
+        r.move_ip(5, 5)
+        self.assertEqual(gm._gm_dirty, [(1, 2, 3, 4)])
+        g = self.colour()
+        g.dirty(r)
+        r.move_ip(5, 5)
+        self.assertEqual(g._orig_dirty, [(6, 7, 3, 4)])
+
+
+    def test_dirty_merge (self):
+        gm = self.gm
+        # side by side: union is exactly what's covered
+        gm.dirty((0, 0, 2, 2), (2, 0, 2, 2))
+        self.assertEqual(gm._gm_dirty, [(0, 0, 4, 2)])
+        # contained
+        gm.dirty((1, 0, 1, 1))
+        self.assertEqual(gm._gm_dirty, [(0, 0, 4, 2)])
+        # overlapping but offset: the union would cover more, though not more
+        # than the sum of their areas
+        gm.dirty((1, 1, 4, 2))
+        self.assertEqual(len(gm._gm_dirty), 2)
+
+
+class DrawTest (unittest.TestCase):
+    def setUp (self):
+        pg.display.init()
+        pg.display.set_mode((20, 20))
+        self.gm = GraphicsManager(sched.Scheduler(), pg.Surface((20, 20)))
+
+    def tearDown (self):
+        pg.display.quit()
+
+    def test_overridden_draw (self):
+        # a subclass's own _draw is used without it having to opt out of
+        # batched blitting
+        calls = []
+
+        class G (Graphic):
+            def _draw (self, dest, rects):
+                calls.append(rects)
+                Graphic._draw(self, dest, rects)
+
+        g = G(pg.Surface((5, 5)))
+        self.gm.add(g, Graphic(pg.Surface((5, 5)), (10, 10)))
+        self.gm.draw()
+        self.assertEqual(len(calls), 1)
+
+    def test_overridden_opaque_in (self):
+        # an opaque graphic that says it covers nothing mustn't hide what's
+        # behind it
+        class Hole (Graphic):
+            def _opaque_in (self, rect):
+                return False
+
+            def _draw (self, dest, rects):
+                pass
+
+        sfc = pg.Surface((5, 5))
+        sfc.fill((255, 0, 0))
+        self.gm.add(Graphic(sfc, layer=1), Hole(pg.Surface((5, 5))))
+        self.gm.draw()
+        self.assertEqual(self.gm.orig_sfc.get_at((2, 2)), (255, 0, 0, 255))
+
+
+    def test_transformed_colour (self):
+        # a Colour that's been resized is drawn as its surface, which may no
+        # longer be one colour
+        gm = GraphicsManager(sched.Scheduler(), pg.Surface((100, 100)))
+        g = Colour((77, 153, 184), (1, 46))
+        gm.add(g)
+        gm.draw()
+        g.resize(88, 40)
+        gm.draw()
+        sfc = g.surface
+        for x in xrange(88):
+            for y in xrange(40):
+                self.assertEqual(gm.orig_sfc.get_at((x, y)), sfc.get_at((x, y)))
+
+
+    def test_refilled_colour (self):
+        gm = self.gm
+        g = Colour((255, 0, 0), (5, 5))
+        gm.add(g)
+        for c in ((255, 0, 0), (0, 0, 0), (0, 255, 0), (0, 0, 255, 100)):
+            g.fill(c)
+            sfc = gm.orig_sfc
+            sfc.fill((255, 255, 255))
+            gm.dirty()
+            want = pg.Surface((5, 5))
+            want.fill((255, 255, 255))
+            want.blit(g.surface, (0, 0))
+            self.assertEqual(gm.orig_sfc.get_at((2, 2)), want.get_at((2, 2)))
+
+
+if __name__ == '__main__':
+    unittest.main()